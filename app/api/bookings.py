@@ -4,18 +4,22 @@ FastAPI routes for class booking operations.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
 from typing import List
 import logging
 
 from app.models.booking_models import BookingRequest, BookingResponse
-from app.services.booking_service import BookingService
+from app.services.booking_service import BookingService, ClassFullError, ClassNotFoundError
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Services are stateless, so a single instance is shared across requests
+_BOOKING_SERVICE = BookingService()
 
-def get_booking_service() -> BookingService:
-    return BookingService()
+
+async def get_booking_service() -> BookingService:
+    return _BOOKING_SERVICE
 
 
 @router.post("/book", response_model=BookingResponse)
@@ -24,21 +28,26 @@ async def book_class(
     booking_service: BookingService = Depends(get_booking_service)
 ):
     try:
-        return booking_service.create_booking(booking)
+        return await booking_service.create_booking(booking)
+    except ClassNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ClassFullError as e:
+        # 409 lets clients tell a sold-out class apart from bad input
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
     except Exception as e:
-        logger.error(f"Booking error: {e}")
+        logger.error("Booking error: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/bookings", response_model=List[BookingResponse])
+@router.get("/bookings", response_model=List[BookingResponse], response_class=ORJSONResponse)
 async def get_bookings_by_email(
     email: str = Query(..., description="Client email to filter bookings"),
     booking_service: BookingService = Depends(get_booking_service)
 ):
     try:
-        return booking_service.get_bookings_by_email(email)
+        return await booking_service.get_bookings_by_email(email)
     except Exception as e:
-        logger.error(f"Error fetching bookings: {e}")
+        logger.error("Error fetching bookings: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
\ No newline at end of file
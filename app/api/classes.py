@@ -3,27 +3,32 @@ Classes API Endpoints
 FastAPI routes for fitness class operations.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
 from typing import List, Optional
 import logging
 
 from app.models.class_models import ClassResponse, ClassStats
 from app.services.class_service import ClassService
 from app.utils.timezone_utils import validate_timezone
+from app.utils.pagination import encode_cursor, decode_cursor
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Services are stateless, so a single instance is shared across requests
+_CLASS_SERVICE = ClassService()
 
-def get_class_service() -> ClassService:
+
+async def get_class_service() -> ClassService:
     """Dependency to get class service instance"""
-    return ClassService()
+    return _CLASS_SERVICE
 
 
 @router.get("/classes", response_model=List[ClassResponse])
 async def get_classes(
+    response: Response,
     timezone: str = Query(
         default=settings.DEFAULT_TIMEZONE,
         description="Timezone for displaying class times"
@@ -41,15 +46,23 @@ async def get_classes(
         le=settings.MAX_PAGE_SIZE,
         description="Maximum number of classes to return"
     ),
+    after: Optional[str] = Query(
+        default=None,
+        description="Cursor from the X-Next-Cursor header of the previous page"
+    ),
     offset: int = Query(
         default=0,
         ge=0,
-        description="Number of classes to skip"
+        deprecated=True,
+        description="Number of classes to skip (deprecated, use `after`)"
     ),
     class_service: ClassService = Depends(get_class_service)
 ):
     """
     Get fitness classes with optional filtering and timezone conversion
+
+    When more classes are available, the cursor for the next page is
+    returned in the X-Next-Cursor response header.
     """
     try:
         if not validate_timezone(timezone):
@@ -58,17 +71,32 @@ async def get_classes(
                 detail=f"Invalid timezone: {timezone}"
             )
 
-        classes = class_service.get_classes(
+        if after and offset:
+            raise HTTPException(
+                status_code=400,
+                detail="Use either `after` or `offset`, not both"
+            )
+
+        try:
+            after_key = decode_cursor(after) if after else None
+        except ValueError as ve:
+            raise HTTPException(status_code=400, detail=str(ve))
+
+        classes, next_key = await class_service.get_classes(
             timezone=timezone,
             upcoming_only=upcoming_only,
             instructor=instructor,
             limit=limit,
-            offset=offset
+            offset=offset,
+            after=after_key
         )
 
+        if next_key:
+            response.headers["X-Next-Cursor"] = encode_cursor(*next_key)
+
         logger.info(
-            f"Retrieved {len(classes)} classes for timezone {timezone}, "
-            f"upcoming_only={upcoming_only}, instructor={instructor}"
+            "Retrieved %d classes for timezone %s, upcoming_only=%s, instructor=%s",
+            len(classes), timezone, upcoming_only, instructor
         )
 
         return classes
@@ -76,53 +104,13 @@ async def get_classes(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving classes: {e}")
+        logger.error("Error retrieving classes: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Internal server error while retrieving classes"
         )
 
 
-@router.get("/classes/{class_id}", response_model=ClassResponse)
-async def get_class_by_id(
-    class_id: int,
-    timezone: str = Query(
-        default=settings.DEFAULT_TIMEZONE,
-        description="Timezone for displaying class time"
-    ),
-    class_service: ClassService = Depends(get_class_service)
-):
-    """
-    Get a specific fitness class by ID
-    """
-    try:
-        if not validate_timezone(timezone):
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid timezone: {timezone}"
-            )
-
-        fitness_class = class_service.get_class_by_id(class_id, timezone)
-
-        if not fitness_class:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Class with ID {class_id} not found"
-            )
-
-        logger.info(f"Retrieved class {class_id} for timezone {timezone}")
-        return fitness_class
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error retrieving class {class_id}: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail="Internal server error while retrieving class"
-        )
-
-
 @router.get("/classes/stats", response_model=ClassStats)
 async def get_class_stats(
     class_service: ClassService = Depends(get_class_service)
@@ -136,7 +124,7 @@ async def get_class_stats(
         return stats
 
     except Exception as e:
-        logger.error(f"Error retrieving class stats: {e}")
+        logger.error("Error retrieving class stats: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Internal server error while retrieving class statistics"
@@ -152,12 +140,53 @@ async def get_instructors(
     """
     try:
         instructors = await class_service.get_instructors()
-        logger.info(f"Retrieved {len(instructors)} instructors")
+        logger.info("Retrieved %d instructors", len(instructors))
         return instructors
 
     except Exception as e:
-        logger.error(f"Error retrieving instructors: {e}")
+        logger.error("Error retrieving instructors: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Internal server error while retrieving instructors"
+        )
+
+
+# Declared after the static /classes/* routes so they aren't captured by {class_id}
+@router.get("/classes/{class_id}", response_model=ClassResponse)
+async def get_class_by_id(
+    class_id: int,
+    timezone: str = Query(
+        default=settings.DEFAULT_TIMEZONE,
+        description="Timezone for displaying class time"
+    ),
+    class_service: ClassService = Depends(get_class_service)
+):
+    """
+    Get a specific fitness class by ID
+    """
+    try:
+        if not validate_timezone(timezone):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid timezone: {timezone}"
+            )
+
+        fitness_class = await class_service.get_class_by_id(class_id, timezone)
+
+        if not fitness_class:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Class with ID {class_id} not found"
+            )
+
+        logger.info("Retrieved class %s for timezone %s", class_id, timezone)
+        return fitness_class
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error retrieving class %s: %s", class_id, e)
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error while retrieving class"
         )
\ No newline at end of file
@@ -10,7 +10,7 @@ router = APIRouter()
 
 @router.get("/health", tags=["Health"])
 async def health_check():
-    db_ok = check_database_health()
+    db_ok = await check_database_health()
     return {
         "status": "ok" if db_ok else "degraded",
         "database": "healthy" if db_ok else "unhealthy"
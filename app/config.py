@@ -22,7 +22,11 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     
     # Database Configuration
+    # A path, or a SQLite URI such as "file:fitness?mode=memory&cache=shared"
     DATABASE_FILE: str = "fitness_studio.db"
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_STATEMENT_CACHE_SIZE: int = 256
+    HEALTH_CHECK_CACHE_TTL: int = 5
     
     # Timezone Configuration
     DEFAULT_TIMEZONE: str = "Asia/Kolkata"
@@ -41,6 +45,10 @@ class Settings(BaseSettings):
     DEFAULT_PAGE_SIZE: int = 50
     MAX_PAGE_SIZE: int = 100
     
+    # Caching
+    CLASS_LIST_CACHE_TTL: int = 30
+    CLASS_STATS_CACHE_TTL: int = 60
+    
     # Business Rules
     MAX_BOOKINGS_PER_USER: int = 5
     BOOKING_ADVANCE_DAYS: int = 30
@@ -56,8 +64,8 @@ settings = Settings()
 
 
 def get_database_path() -> str:
-    """Get the full database path"""
-    if os.path.isabs(settings.DATABASE_FILE):
+    """Get the full database path, SQLite URIs are returned unchanged"""
+    if settings.DATABASE_FILE.startswith("file:") or os.path.isabs(settings.DATABASE_FILE):
         return settings.DATABASE_FILE
     return os.path.join(os.getcwd(), settings.DATABASE_FILE)
 
@@ -3,37 +3,117 @@ Database Configuration and Management
 SQLite database setup and connection handling for the Fitness Studio Booking API.
 """
 
+import asyncio
 import sqlite3
 import logging
-from contextlib import contextmanager
-from typing import Generator
+import time
+from contextlib import contextmanager, asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Generator, Optional, Tuple
+
+import aiosqlite
+from aiosqlitepool import SQLiteConnectionPool
 
 from app.config import settings, get_database_path
 
 logger = logging.getLogger(__name__)
 
+# Connection settings: WAL lets readers run alongside the writer, and
+# synchronous=NORMAL is safe under WAL while avoiding an fsync per commit
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+)
+
+_pool: Optional[SQLiteConnectionPool] = None
+
+# SQLite allows a single writer, so writes share one connection behind a lock
+_writer: Optional[aiosqlite.Connection] = None
+_writer_lock: Optional[asyncio.Lock] = None
+
+# Cached (healthy, expires_at) result of the last health probe
+_health_status: Optional[Tuple[bool, float]] = None
+_health_lock = asyncio.Lock()
+
+# datetime_utc holds unix epoch seconds
+CLASSES_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        instructor TEXT NOT NULL,
+        datetime_utc INTEGER NOT NULL,
+        total_slots INTEGER NOT NULL,
+        available_slots INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+
+def _migrate_classes_datetime_to_epoch(conn: sqlite3.Connection) -> None:
+    """
+    Rebuild a classes table that still stores datetime_utc as ISO text
+    Values are converted to INTEGER unix seconds in a single transaction,
+    the migration refuses to start if any value can't be parsed
+    """
+    columns = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(classes)")}
+    if columns.get("datetime_utc", "").upper() != "TEXT":
+        return
+    
+    bad_rows = conn.execute(
+        "SELECT id, datetime_utc FROM classes WHERE strftime('%s', datetime_utc) IS NULL"
+    ).fetchall()
+    if bad_rows:
+        raise ValueError(
+            "Cannot migrate classes.datetime_utc to epoch seconds, "
+            f"unparseable values (id, datetime_utc): {[tuple(row) for row in bad_rows]}"
+        )
+    
+    # DROP TABLE removes the AUTOINCREMENT counter, carry it over so ids of
+    # deleted classes are never reused
+    sequence = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'classes'").fetchone()
+    restore_sequence = (
+        "DELETE FROM sqlite_sequence WHERE name = 'classes';"
+        f"INSERT INTO sqlite_sequence (name, seq) VALUES ('classes', {int(sequence[0])});"
+        if sequence else ""
+    )
+    
+    logger.info("Migrating classes.datetime_utc from ISO text to epoch seconds")
+    conn.executescript(f'''
+        PRAGMA foreign_keys=OFF;
+        BEGIN;
+        {CLASSES_TABLE_SQL.format(table="classes_new")};
+        INSERT INTO classes_new
+            (id, name, instructor, datetime_utc, total_slots, available_slots, created_at, updated_at)
+        SELECT id, name, instructor, CAST(strftime('%s', datetime_utc) AS INTEGER),
+               total_slots, available_slots, created_at, updated_at
+        FROM classes;
+        DROP TABLE classes;
+        ALTER TABLE classes_new RENAME TO classes;
+        {restore_sequence}
+        COMMIT;
+        PRAGMA foreign_keys=ON;
+    ''')
+
 
 def init_database() -> None:
     """Initialize the SQLite database with required tables"""
     database_path = get_database_path()
     
     try:
-        conn = sqlite3.connect(database_path)
+        conn = sqlite3.connect(database_path, uri=True)
         cursor = conn.cursor()
         
+        for pragma in CONNECTION_PRAGMAS:
+            cursor.execute(pragma)
+        
         # Create classes table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS classes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                instructor TEXT NOT NULL,
-                datetime_utc TEXT NOT NULL,
-                total_slots INTEGER NOT NULL,
-                available_slots INTEGER NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        cursor.execute(CLASSES_TABLE_SQL.format(table="classes"))
+        _migrate_classes_datetime_to_epoch(conn)
         
         # Create bookings table
         cursor.execute('''
@@ -50,14 +130,24 @@ def init_database() -> None:
         ''')
         
         # Create indexes for better performance
+        # (datetime_utc, id) matches the keyset pagination order in get_classes
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_classes_dt_id 
+            ON classes(datetime_utc, id)
+        ''')
+        
+        # (instructor, datetime_utc) serves the instructor filter with the
+        # time-ordered scan in get_classes, and DISTINCT instructor lookups
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_classes_datetime 
-            ON classes(datetime_utc)
+            CREATE INDEX IF NOT EXISTS idx_classes_instructor_dt 
+            ON classes(instructor, datetime_utc)
         ''')
         
+        # (client_email, booking_time) serves both the filter and the ORDER BY
+        # in get_bookings_by_email without a temp B-tree sort
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_bookings_email 
-            ON bookings(client_email)
+            CREATE INDEX IF NOT EXISTS idx_bookings_email_time 
+            ON bookings(client_email, booking_time DESC)
         ''')
         
         cursor.execute('''
@@ -65,13 +155,17 @@ def init_database() -> None:
             ON bookings(class_id)
         ''')
         
+        # Superseded by the composite indexes above
+        cursor.execute("DROP INDEX IF EXISTS idx_classes_datetime")
+        cursor.execute("DROP INDEX IF EXISTS idx_bookings_email")
+        
         conn.commit()
         conn.close()
         
-        logger.info(f"Database initialized successfully at {database_path}")
+        logger.info("Database initialized successfully at %s", database_path)
         
     except Exception as e:
-        logger.error(f"Error initializing database: {e}")
+        logger.error("Error initializing database: %s", e)
         raise
 
 
@@ -82,127 +176,238 @@ def get_db_connection() -> Generator[sqlite3.Connection, None, None]:
     Ensures proper connection handling and cleanup
     """
     database_path = get_database_path()
-    conn = sqlite3.connect(database_path)
+    conn = sqlite3.connect(
+        database_path,
+        uri=True,
+        cached_statements=settings.DATABASE_STATEMENT_CACHE_SIZE
+    )
     conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     
     try:
         yield conn
     except Exception as e:
         conn.rollback()
-        logger.error(f"Database error: {e}")
+        logger.error("Database error: %s", e)
         raise
     finally:
         conn.close()
 
 
-def execute_query(query: str, params: tuple = ()) -> list:
+async def create_pooled_connection() -> aiosqlite.Connection:
+    """
+    Connection factory for the async pool
+    PRAGMAs are applied once here and persist for the connection's lifetime
     """
-    Execute a SELECT query and return results
+    conn = await aiosqlite.connect(
+        get_database_path(),
+        uri=True,
+        cached_statements=settings.DATABASE_STATEMENT_CACHE_SIZE
+    )
+    conn.row_factory = aiosqlite.Row
+    for pragma in CONNECTION_PRAGMAS:
+        await conn.execute(pragma)
+    return conn
+
+
+async def open_pool() -> SQLiteConnectionPool:
+    """Create the application-wide connection pool"""
+    global _pool
+    _pool = SQLiteConnectionPool(
+        create_pooled_connection,
+        pool_size=settings.DATABASE_POOL_SIZE
+    )
+    logger.info("Database pool opened with %s connections", settings.DATABASE_POOL_SIZE)
+    return _pool
+
+
+async def close_pool() -> None:
+    """Close all pooled connections"""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+def get_pool() -> SQLiteConnectionPool:
+    """Get the application-wide connection pool"""
+    if _pool is None:
+        raise RuntimeError("Database pool is not open")
+    return _pool
+
+
+async def open_writer() -> aiosqlite.Connection:
+    """Open the dedicated writer connection"""
+    global _writer, _writer_lock
+    _writer = await create_pooled_connection()
+    _writer_lock = asyncio.Lock()
+    return _writer
+
+
+async def close_writer() -> None:
+    """Close the dedicated writer connection"""
+    global _writer, _writer_lock
+    if _writer is not None:
+        await _writer.close()
+        _writer = None
+        _writer_lock = None
+
+
+@asynccontextmanager
+async def get_writer_connection() -> AsyncGenerator[aiosqlite.Connection, None]:
+    """
+    Async context manager for the writer connection
+    Writers queue on an asyncio.Lock instead of contending for SQLite's
+    write lock and retrying on SQLITE_BUSY
+    """
+    if _writer is None:
+        raise RuntimeError("Database writer is not open")
     
-    Args:
-        query: SQL query string
-        params: Query parameters
-        
-    Returns:
-        List of query results
+    async with _writer_lock:
+        try:
+            yield _writer
+        except Exception as e:
+            await _writer.rollback()
+            logger.error("Database error: %s", e)
+            raise
+        except BaseException:
+            # Cancellation skips the handler above, roll back anyway so the shared
+            # writer doesn't stay in a transaction holding SQLite's write lock.
+            # aiosqlite runs this after any statement still in flight
+            await _writer.rollback()
+            raise
+
+
+@asynccontextmanager
+async def get_pooled_connection() -> AsyncGenerator[aiosqlite.Connection, None]:
     """
-    try:
-        with get_db_connection() as conn:
-            cursor = conn.execute(query, params)
-            return cursor.fetchall()
-    except Exception as e:
-        logger.error(f"Error executing query: {e}")
-        raise
+    Async context manager for pooled database connections
+    Rolls back on error so the connection goes back to the pool clean
+    """
+    async with get_pool().connection() as conn:
+        try:
+            yield conn
+        except Exception as e:
+            await conn.rollback()
+            logger.error("Database error: %s", e)
+            raise
 
 
-def execute_insert(query: str, params: tuple = ()) -> int:
+async def execute_query_tuples(query: str, params: tuple = ()) -> list:
     """
-    Execute an INSERT query and return the last row ID
+    Execute a SELECT query and return results as plain tuples
+    Skips Row construction for hot read paths that unpack positionally
     
     Args:
         query: SQL query string
         params: Query parameters
         
     Returns:
-        Last inserted row ID
+        List of row tuples
     """
     try:
-        with get_db_connection() as conn:
-            cursor = conn.execute(query, params)
-            conn.commit()
-            return cursor.lastrowid
+        async with get_pooled_connection() as conn:
+            async with conn.execute(query, params) as cursor:
+                cursor.row_factory = None
+                return await cursor.fetchall()
     except Exception as e:
-        logger.error(f"Error executing insert: {e}")
+        logger.error("Error executing query: %s", e)
         raise
 
 
-def execute_update(query: str, params: tuple = ()) -> int:
+async def iter_query(query: str, params: tuple = (), arraysize: int = 128) -> AsyncIterator[tuple]:
     """
-    Execute an UPDATE query and return the number of affected rows
+    Execute a SELECT query and yield the results as plain tuples
+    Rows are fetched arraysize at a time. The pooled connection is held
+    until the generator finishes, so consume it with contextlib.aclosing
+    to return the connection promptly if the caller stops early
     
     Args:
         query: SQL query string
         params: Query parameters
+        arraysize: Number of rows fetched per round trip to the database thread
         
-    Returns:
-        Number of affected rows
+    Yields:
+        Row tuples
     """
     try:
-        with get_db_connection() as conn:
-            cursor = conn.execute(query, params)
-            conn.commit()
-            return cursor.rowcount
+        async with get_pooled_connection() as conn:
+            async with conn.execute(query, params) as cursor:
+                cursor.row_factory = None
+                cursor.iter_chunk_size = arraysize
+                async for row in cursor:
+                    yield row
     except Exception as e:
-        logger.error(f"Error executing update: {e}")
+        logger.error("Error executing query: %s", e)
         raise
 
 
-def get_table_count(table_name: str) -> int:
+def execute_many(query: str, params_list: list) -> int:
     """
-    Get the number of records in a table
+    Execute a statement for each parameter set in a single transaction
+    Synchronous, for scripts that run outside the event loop
     
     Args:
-        table_name: Name of the table
+        query: SQL query string
+        params_list: Sequence of query parameters
         
     Returns:
-        Number of records
+        Number of affected rows
     """
     try:
         with get_db_connection() as conn:
-            cursor = conn.execute(f"SELECT COUNT(*) as count FROM {table_name}")
-            result = cursor.fetchone()
-            return result["count"] if result else 0
+            cursor = conn.executemany(query, params_list)
+            conn.commit()
+            return cursor.rowcount
     except Exception as e:
-        logger.error(f"Error getting table count: {e}")
-        return 0
+        logger.error("Error executing batch: %s", e)
+        raise
 
 
-def check_database_health() -> bool:
-    """
-    Check if the database is accessible and has the required tables
-    
-    Returns:
-        True if database is healthy, False otherwise
-    """
+async def _probe_database() -> bool:
+    """Check that the required tables exist and the database is readable"""
     try:
-        with get_db_connection() as conn:
+        async with get_pooled_connection() as conn:
             # Check if tables exist
-            cursor = conn.execute('''
+            tables = await conn.execute_fetchall('''
                 SELECT name FROM sqlite_master 
                 WHERE type='table' AND name IN ('classes', 'bookings')
             ''')
-            tables = cursor.fetchall()
             
             if len(tables) != 2:
                 logger.warning("Database missing required tables")
                 return False
                 
             # Check if we can perform basic operations
-            cursor.execute("SELECT COUNT(*) FROM classes")
-            cursor.execute("SELECT COUNT(*) FROM bookings")
+            await conn.execute_fetchall("SELECT 1")
             
             return True
             
     except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        return False
\ No newline at end of file
+        logger.error("Database health check failed: %s", e)
+        return False
+
+
+async def check_database_health() -> bool:
+    """
+    Check if the database is accessible and has the required tables
+    The result is cached for HEALTH_CHECK_CACHE_TTL seconds so frequent
+    liveness probes don't hit the database on every request
+    
+    Returns:
+        True if database is healthy, False otherwise
+    """
+    global _health_status
+    
+    if _health_status is not None and _health_status[1] > time.monotonic():
+        return _health_status[0]
+    
+    async with _health_lock:
+        # Another request may have refreshed the status while we waited
+        if _health_status is not None and _health_status[1] > time.monotonic():
+            return _health_status[0]
+        
+        healthy = await _probe_database()
+        _health_status = (healthy, time.monotonic() + settings.HEALTH_CHECK_CACHE_TTL)
+        return healthy
\ No newline at end of file
@@ -3,12 +3,14 @@ Fitness Studio Booking API - Main Application
 FastAPI application with comprehensive booking system for fitness classes.
 """
 
+import asyncio
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.config import settings
-from app.database import init_database
+from app.database import init_database, open_pool, close_pool, open_writer, close_writer
 from app.api.classes import router as classes_router
 from app.api.bookings import router as bookings_router
 from app.api.health import router as health_router
@@ -24,17 +26,24 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("🚀 Starting Fitness Studio Booking API...")
     init_database()
-    seed_sample_data()
+    # Seeding is blocking sqlite3 work, keep it off the event loop
+    await asyncio.to_thread(seed_sample_data)
+    # The pool and writer are reached through app.database's accessors
+    await open_pool()
+    await open_writer()
     logger.info("✅ Database initialized and seeded successfully")
     yield
     # Shutdown
     logger.info("👋 Shutting down Fitness Studio Booking API...")
+    await close_writer()
+    await close_pool()
 
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
     description=settings.APP_DESCRIPTION,
     version=settings.APP_VERSION,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -45,6 +54,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets cross-origin browser clients read the pagination cursor
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers
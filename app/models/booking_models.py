@@ -10,8 +10,8 @@ from pydantic import BaseModel, EmailStr, Field, validator
 from app.config import settings
 
 
-class BookingBase(BaseModel):
-    """Base booking model with common fields"""
+class BookingInputBase(BaseModel):
+    """Base model for client-supplied booking fields"""
     client_name: str = Field(..., min_length=2, max_length=100, description="Client full name")
     client_email: EmailStr = Field(..., description="Client email address")
     
@@ -23,7 +23,14 @@ class BookingBase(BaseModel):
         return v.strip()
 
 
-class BookingRequest(BookingBase):
+class BookingResponseBase(BaseModel):
+    """Base model for booking fields read back from the database"""
+    # Emails were validated on the way in, so responses skip EmailStr checks
+    client_name: str = Field(..., description="Client full name")
+    client_email: str = Field(..., description="Client email address")
+
+
+class BookingRequest(BookingInputBase):
     """Model for booking request"""
     class_id: int = Field(..., ge=1, description="ID of the class to book")
     timezone: str = Field(
@@ -42,7 +49,7 @@ class BookingRequest(BookingBase):
         }
 
 
-class BookingResponse(BookingBase):
+class BookingResponse(BookingResponseBase):
     """Model for booking response"""
     id: str = Field(..., description="Unique booking ID")
     class_id: int = Field(..., description="Class ID")
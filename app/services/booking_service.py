@@ -3,44 +3,84 @@ Booking Service
 Business logic for managing class bookings.
 """
 
-import uuid
-from datetime import datetime
+from datetime import datetime, UTC
 from typing import List
 
+from uuid6 import uuid7
+
 from app.models.booking_models import BookingRequest, BookingResponse
-from app.database import execute_query, execute_insert
-from app.utils.timezone_utils import convert_utc_to_local
+from app.database import get_pooled_connection, get_writer_connection
+from app.services.class_service import invalidate_class_caches
+from app.utils.timezone_utils import format_local, format_local_uncached, get_tz
+from app.config import settings
+
+# Hot statements, kept as constants so each pooled connection's statement
+# cache sees the exact same SQL text on every call
+_Q_RESERVE_SLOT = """
+    UPDATE classes SET available_slots = available_slots - 1
+    WHERE id = ? AND available_slots > 0
+    RETURNING name, instructor, datetime_utc
+"""
+
+_Q_CLASS_EXISTS = "SELECT 1 FROM classes WHERE id = ?"
+
+_Q_INSERT_BOOKING = """
+    INSERT INTO bookings (id, class_id, client_name, client_email, booking_time)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_Q_BOOKINGS_BY_EMAIL = """
+    SELECT b.id, b.class_id, b.client_name, b.client_email, b.booking_time, b.status,
+           c.name as class_name, c.instructor, c.datetime_utc
+    FROM bookings b
+    JOIN classes c ON b.class_id = c.id
+    WHERE b.client_email = ?
+    ORDER BY b.booking_time DESC
+"""
+
+
+class ClassNotFoundError(ValueError):
+    """Raised when booking a class that does not exist"""
+
+
+class ClassFullError(ValueError):
+    """Raised when booking a class with no available slots"""
 
 
 class BookingService:
-    def create_booking(self, booking: BookingRequest) -> BookingResponse:
-        # Check class availability
-        class_row = execute_query("SELECT * FROM classes WHERE id = ?", (booking.class_id,))
-        if not class_row:
-            raise ValueError("Class not found")
-
-        class_data = class_row[0]
-        if class_data["available_slots"] <= 0:
-            raise ValueError("No available slots")
-
-        # Create booking
-        booking_id = str(uuid.uuid4())
-        booking_time = datetime.utcnow().isoformat()
-
-        execute_insert(
-            """
-            INSERT INTO bookings (id, class_id, client_name, client_email, booking_time)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (booking_id, booking.class_id, booking.client_name, booking.client_email, booking_time)
-        )
+    async def create_booking(self, booking: BookingRequest) -> BookingResponse:
+        # Time-ordered IDs keep inserts at the tail of the primary key index
+        booking_id = str(uuid7())
+        booking_time = datetime.now(UTC).isoformat()
 
-        # Update available slots
-        execute_insert(
-            "UPDATE classes SET available_slots = available_slots - 1 WHERE id = ?",
-            (booking.class_id,)
-        )
+        async with get_writer_connection() as conn:
+            # Take the write lock up front so the slot check and decrement are atomic
+            await conn.execute("BEGIN IMMEDIATE")
+
+            # Reserve a slot, only succeeds while the class still has one left
+            async with conn.execute(_Q_RESERVE_SLOT, (booking.class_id,)) as cursor:
+                class_data = await cursor.fetchone()
+
+            if class_data is None:
+                await conn.rollback()
+                class_exists = bool(await conn.execute_fetchall(_Q_CLASS_EXISTS, (booking.class_id,)))
+            else:
+                await conn.execute(
+                    _Q_INSERT_BOOKING,
+                    (booking_id, booking.class_id, booking.client_name, booking.client_email, booking_time)
+                )
+                await conn.commit()
+
+        # Raised outside the connection context, these are booking outcomes
+        # rather than database errors
+        if class_data is None:
+            if class_exists:
+                raise ClassFullError("No available slots")
+            raise ClassNotFoundError("Class not found")
+
+        invalidate_class_caches()
 
+        tz = get_tz(booking.timezone)
         return BookingResponse(
             id=booking_id,
             class_id=booking.class_id,
@@ -48,32 +88,29 @@ class BookingService:
             instructor=class_data["instructor"],
             client_name=booking.client_name,
             client_email=booking.client_email,
-            class_datetime_local=convert_utc_to_local(class_data["datetime_utc"], booking.timezone),
+            class_datetime_local=format_local(class_data["datetime_utc"], tz),
             timezone=booking.timezone,
-            booking_time=convert_utc_to_local(booking_time, booking.timezone),
+            booking_time=format_local_uncached(booking_time, tz),
             status="confirmed"
         )
 
-    def get_bookings_by_email(self, email: str) -> List[BookingResponse]:
-        query = """
-        SELECT b.*, c.name as class_name, c.instructor, c.datetime_utc
-        FROM bookings b
-        JOIN classes c ON b.class_id = c.id
-        WHERE b.client_email = ?
-        ORDER BY b.booking_time DESC
-        """
-        rows = execute_query(query, (email,))
+    async def get_bookings_by_email(self, email: str) -> List[BookingResponse]:
+        async with get_pooled_connection() as conn:
+            rows = await conn.execute_fetchall(_Q_BOOKINGS_BY_EMAIL, (email,))
+        timezone = settings.DEFAULT_TIMEZONE
+        tz = get_tz(timezone)
+        # Rows come from our own inserts, so skip re-validating each one
         return [
-            BookingResponse(
+            BookingResponse.construct(
                 id=row["id"],
                 class_id=row["class_id"],
                 class_name=row["class_name"],
                 instructor=row["instructor"],
                 client_name=row["client_name"],
                 client_email=row["client_email"],
-                class_datetime_local=convert_utc_to_local(row["datetime_utc"], "Asia/Kolkata"),
-                timezone="Asia/Kolkata",
-                booking_time=convert_utc_to_local(row["booking_time"], "Asia/Kolkata"),
+                class_datetime_local=format_local(row["datetime_utc"], tz),
+                timezone=timezone,
+                booking_time=format_local_uncached(row["booking_time"], tz),
                 status=row["status"]
             )
             for row in rows
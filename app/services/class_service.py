@@ -3,90 +3,170 @@ Class Service
 Business logic for managing fitness classes.
 """
 
+import itertools
+import sys
+import time
 import uuid
-from datetime import datetime,UTC
-from typing import List, Optional
+from contextlib import aclosing
+from typing import List, Optional, Tuple
 
 from app.models.class_models import ClassResponse, ClassStats
-from app.database import execute_query
-from app.utils.timezone_utils import convert_utc_to_local
-from app.config import get_database_path
+from app.database import execute_query_tuples, iter_query
+from app.utils.timezone_utils import format_local, get_tz
+from app.utils.cache import AsyncTTLCache
+from app.config import get_database_path, settings
+
+# Class reads change slowly, serve them from short-lived caches
+_classes_cache = AsyncTTLCache(ttl=settings.CLASS_LIST_CACHE_TTL, maxsize=1024)
+_stats_cache = AsyncTTLCache(ttl=settings.CLASS_STATS_CACHE_TTL)
+_instructors_cache = AsyncTTLCache(ttl=settings.CLASS_STATS_CACHE_TTL)
+
+_CLASS_COLUMNS = "id, name, instructor, datetime_utc, available_slots, total_slots"
+
+_Q_LIST_CLASSES = f"SELECT {_CLASS_COLUMNS} FROM classes"
+
+
+def _build_list_query(after: bool, upcoming_only: bool, instructor: bool) -> str:
+    filters = []
+    if after:
+        filters.append("(datetime_utc, id) > (?, ?)")
+    if upcoming_only:
+        filters.append("datetime_utc > ?")
+    if instructor:
+        filters.append("instructor = ?")
+
+    query = _Q_LIST_CLASSES
+    if filters:
+        query += " WHERE " + " AND ".join(filters)
+    return query + " ORDER BY datetime_utc ASC, id ASC LIMIT ? OFFSET ?"
+
+
+# Every filter combination is built once, keyed on (after, upcoming_only, instructor),
+# so each request reuses an identical SQL string
+_Q_LIST_CLASSES_BY_FILTERS = {
+    key: _build_list_query(*key) for key in itertools.product((False, True), repeat=3)
+}
+
+_Q_GET_BY_ID = f"SELECT {_CLASS_COLUMNS} FROM classes WHERE id = ?"
+
+_Q_CLASS_STATS = """
+    SELECT
+        (SELECT COUNT(*) FROM classes) AS total_classes,
+        (SELECT COUNT(*) FROM classes WHERE datetime_utc > ?) AS upcoming_classes,
+        (SELECT COUNT(*) FROM bookings) AS total_bookings,
+        (SELECT instructor FROM classes
+         GROUP BY instructor ORDER BY COUNT(*) DESC LIMIT 1) AS popular_instructor
+"""
+
+_Q_INSTRUCTORS = "SELECT DISTINCT instructor FROM classes ORDER BY instructor ASC"
+
+
+def _now_bucket(granularity: int = 60) -> int:
+    """Current epoch seconds rounded down to the granularity, for "upcoming" cutoffs"""
+    return int(time.time()) // granularity * granularity
+
+
+def invalidate_class_caches() -> None:
+    """Drop cached class reads after classes or bookings change"""
+    _classes_cache.invalidate()
+    _stats_cache.invalidate()
+    _instructors_cache.invalidate()
 
 
 class ClassService:
-    def get_classes(
+    async def get_classes(
         self,
         timezone: str,
         upcoming_only: bool = True,
         instructor: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
-    ) -> List[ClassResponse]:
-        query = "SELECT * FROM classes"
-        filters = []
+        offset: int = 0,
+        after: Optional[Tuple[int, int]] = None
+    ) -> Tuple[List[ClassResponse], Optional[Tuple[int, int]]]:
+        """
+        Get a page of classes ordered by (datetime_utc, id)
+
+        Pages are keyed on the (datetime_utc, id) of the previous page's last
+        row, so deep pages cost an index seek rather than an OFFSET scan.
+        Returns the page and the key to pass as `after` for the next page,
+        or None when there are no more rows.
+        """
+        # Interned so the list cache key and get_tz lookups compare one shared string,
+        # format_local is keyed on the resolved tzinfo and is unaffected
+        timezone = sys.intern(timezone)
+        key = (timezone, upcoming_only, instructor, limit, offset, after)
+        return await _classes_cache.get_or_load(
+            key,
+            lambda: self._load_classes(timezone, upcoming_only, instructor, limit, offset, after)
+        )
+
+    async def _load_classes(
+        self,
+        timezone: str,
+        upcoming_only: bool,
+        instructor: Optional[str],
+        limit: int,
+        offset: int,
+        after: Optional[Tuple[int, int]]
+    ) -> Tuple[List[ClassResponse], Optional[Tuple[int, int]]]:
+        query = _Q_LIST_CLASSES_BY_FILTERS[(bool(after), bool(upcoming_only), bool(instructor))]
         params = []
 
+        if after:
+            params.extend(after)
+
         if upcoming_only:
-            filters.append("datetime_utc > ?")
-            params.append(datetime.now(UTC).isoformat())
+            params.append(_now_bucket())
 
         if instructor:
-            filters.append("instructor = ?")
             params.append(instructor)
 
-        if filters:
-            query += " WHERE " + " AND ".join(filters)
-
-        query += " ORDER BY datetime_utc ASC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        rows = execute_query(query, tuple(params))
-
-        return [
-            ClassResponse(
-                id=row["id"],
-                name=row["name"],
-                instructor=row["instructor"],
-                datetime_local=convert_utc_to_local(row["datetime_utc"], timezone),
-                timezone=timezone,
-                available_slots=row["available_slots"],
-                total_slots=row["total_slots"]
-            )
-            for row in rows
-        ]
-
-    def get_class_by_id(self, class_id: int, timezone: str) -> Optional[ClassResponse]:
-        query = "SELECT * FROM classes WHERE id = ?"
-        rows = execute_query(query, (class_id,))
+        tz = get_tz(timezone)
+        classes = []
+        last_key = None
+        # Rows come straight from the classes table, skip per-row validation
+        async with aclosing(iter_query(query, tuple(params), arraysize=limit)) as rows:
+            async for class_id, name, class_instructor, datetime_utc, available_slots, total_slots in rows:
+                classes.append(ClassResponse.construct(
+                    id=class_id,
+                    name=name,
+                    instructor=class_instructor,
+                    datetime_local=format_local(datetime_utc, tz),
+                    timezone=timezone,
+                    available_slots=available_slots,
+                    total_slots=total_slots
+                ))
+                last_key = (datetime_utc, class_id)
+
+        next_key = last_key if len(classes) == limit else None
+        return classes, next_key
+
+    async def get_class_by_id(self, class_id: int, timezone: str) -> Optional[ClassResponse]:
+        timezone = sys.intern(timezone)
+        rows = await execute_query_tuples(_Q_GET_BY_ID, (class_id,))
         if not rows:
             return None
 
-        row = rows[0]
-        return ClassResponse(
-            id=row["id"],
-            name=row["name"],
-            instructor=row["instructor"],
-            datetime_local=convert_utc_to_local(row["datetime_utc"], timezone),
+        _, name, instructor, datetime_utc, available_slots, total_slots = rows[0]
+        tz = get_tz(timezone)
+        return ClassResponse.construct(
+            id=class_id,
+            name=name,
+            instructor=instructor,
+            datetime_local=format_local(datetime_utc, tz),
             timezone=timezone,
-            available_slots=row["available_slots"],
-            total_slots=row["total_slots"]
+            available_slots=available_slots,
+            total_slots=total_slots
         )
 
-    def get_class_stats(self) -> ClassStats:
-        total_classes = execute_query("SELECT COUNT(*) as count FROM classes")[0]["count"]
-        upcoming_classes = execute_query(
-            "SELECT COUNT(*) as count FROM classes WHERE datetime_utc > ?",
-            (datetime.utcnow().isoformat(),)
-        )[0]["count"]
-        total_bookings = execute_query("SELECT COUNT(*) as count FROM bookings")[0]["count"]
-        popular = execute_query("""
-            SELECT instructor, COUNT(*) as count
-            FROM classes
-            GROUP BY instructor
-            ORDER BY count DESC
-            LIMIT 1
-        """)
-        popular_instructor = popular[0]["instructor"] if popular else None
+    async def get_class_stats(self) -> ClassStats:
+        return await _stats_cache.get_or_load("stats", self._load_class_stats)
+
+    async def _load_class_stats(self) -> ClassStats:
+        rows = await execute_query_tuples(_Q_CLASS_STATS, (_now_bucket(),))
+        total_classes, upcoming_classes, total_bookings, popular_instructor = rows[0]
 
         return ClassStats(
             total_classes=total_classes,
@@ -95,6 +175,9 @@ class ClassService:
             popular_instructor=popular_instructor
         )
 
-    def get_instructors(self) -> List[str]:
-        rows = execute_query("SELECT DISTINCT instructor FROM classes ORDER BY instructor ASC")
-        return [row["instructor"] for row in rows]
\ No newline at end of file
+    async def get_instructors(self) -> List[str]:
+        return await _instructors_cache.get_or_load("instructors", self._load_instructors)
+
+    async def _load_instructors(self) -> List[str]:
+        rows = await execute_query_tuples(_Q_INSTRUCTORS)
+        return [instructor for (instructor,) in rows]
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Cache Utilities
+Small in-process TTL cache for slow-changing read endpoints.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class AsyncTTLCache:
+    """
+    In-process TTL cache with single-flight population
+
+    On a miss only one coroutine runs the loader for a given key, concurrent
+    callers wait for it instead of all hitting the database at expiry.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        # Coroutines holding or waiting on each key's lock
+        self._lock_users: Dict[Hashable, int] = {}
+        self._generation = 0
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return True, entry[0]
+        return False, None
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, loading it on a miss"""
+        hit, value = self._lookup(key)
+        if hit:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                # Another coroutine may have loaded it while we waited
+                hit, value = self._lookup(key)
+                if hit:
+                    return value
+
+                generation = self._generation
+                value = await loader()
+
+                # Don't store a value loaded before an invalidation
+                if generation == self._generation:
+                    if len(self._entries) >= self.maxsize and key not in self._entries:
+                        self._entries.pop(next(iter(self._entries)))
+                    self._entries[key] = (value, time.monotonic() + self.ttl)
+                return value
+        finally:
+            # The lock stays registered while anyone holds or waits on it, so
+            # arrivals after an invalidation queue behind the same loader
+            # instead of starting a second one
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                del self._lock_users[key]
+                del self._locks[key]
+
+    def invalidate(self) -> None:
+        """Drop all cached entries"""
+        self._generation += 1
+        self._entries.clear()
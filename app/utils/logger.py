@@ -1,15 +1,30 @@
 """
 Logger Configuration
 Sets up application-wide logging.
+
+Log calls use lazy %-style arguments, e.g. logger.debug("row=%s", row),
+rather than f-strings, so messages below the configured level are never
+formatted.
 """
 
 import logging
 from app.config import settings
 
+# "fitness-api" is the application logger, module loggers live under "app"
+_LOGGER_NAMES = ("fitness-api", "app")
+
 
 def setup_logging() -> logging.Logger:
-    logging.basicConfig(
-        level=settings.LOG_LEVEL,
-        format=settings.LOG_FORMAT
-    )
-    return logging.getLogger("fitness-api")
\ No newline at end of file
+    formatter = logging.Formatter(settings.LOG_FORMAT)
+    
+    for name in _LOGGER_NAMES:
+        logger = logging.getLogger(name)
+        logger.setLevel(settings.LOG_LEVEL)
+        logger.propagate = False
+        # Safe to call again on re-import without stacking handlers
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+    
+    return logging.getLogger("fitness-api")
@@ -0,0 +1,23 @@
+"""
+Pagination Utilities
+Encodes and decodes opaque keyset pagination cursors.
+"""
+
+import base64
+from typing import Tuple
+
+
+def encode_cursor(datetime_utc: int, class_id: int) -> str:
+    """Encode the sort key of the last returned row as an opaque cursor"""
+    raw = f"{datetime_utc}|{class_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """Decode a cursor back into its (datetime_utc, id) sort key"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        datetime_utc, class_id = raw.rsplit("|", 1)
+        return int(datetime_utc), int(class_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -3,18 +3,49 @@ Timezone Utilities
 Handles timezone conversion and validation.
 """
 
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone as dt_timezone, tzinfo
+from functools import lru_cache
+from typing import Union
+from zoneinfo import ZoneInfo, available_timezones
 
+_VALID_TIMEZONES = frozenset(available_timezones())
 
-def convert_utc_to_local(utc_str: str, timezone: str) -> str:
-    """Convert UTC ISO string to local time string"""
-    utc_dt = datetime.fromisoformat(utc_str.replace("Z", "+00:00"))
-    local_tz = pytz.timezone(timezone)
-    local_dt = utc_dt.astimezone(local_tz)
-    return local_dt.strftime("%Y-%m-%d %H:%M:%S")
+
+@lru_cache(maxsize=512)
+def get_tz(timezone: str) -> tzinfo:
+    """Get a timezone object, resolved once per timezone name"""
+    return ZoneInfo(timezone)
+
+
+def format_local_uncached(utc_value: Union[int, str], tz: tzinfo) -> str:
+    """
+    Convert a UTC epoch timestamp or ISO string to local time string
+    using a resolved timezone
+    For one-off values such as booking times, which would only evict
+    entries from the format_local memo
+    """
+    if isinstance(utc_value, int):
+        local_dt = datetime.fromtimestamp(utc_value, tz)
+    else:
+        utc_dt = datetime.fromisoformat(utc_value)
+        if utc_dt.tzinfo is None:
+            # Rows written before timestamps carried an offset are naive UTC
+            utc_dt = utc_dt.replace(tzinfo=dt_timezone.utc)
+        local_dt = utc_dt.astimezone(tz)
+    # Same output as strftime("%Y-%m-%d %H:%M:%S") without the format parser,
+    # slicing off the UTC offset
+    return local_dt.isoformat(sep=" ", timespec="seconds")[:19]
+
+
+@lru_cache(maxsize=8192)
+def format_local(utc_value: Union[int, str], tz: tzinfo) -> str:
+    """
+    Memoized format_local_uncached for class times, the same class
+    times are formatted for many viewers
+    """
+    return format_local_uncached(utc_value, tz)
 
 
 def validate_timezone(tz: str) -> bool:
     """Check if a timezone string is valid"""
-    return tz in pytz.all_timezones
\ No newline at end of file
+    return tz in _VALID_TIMEZONES
\ No newline at end of file
@@ -0,0 +1,25 @@
+import os
+import sqlite3
+
+# Run the suite against a shared-cache in-memory database, this has to be
+# set before the app is imported since settings are read at import time
+os.environ["DATABASE_FILE"] = "file:fitness_test?mode=memory&cache=shared"
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.config import get_database_path
+from app.database import init_database
+from scripts.seed_data import seed_sample_data
+
+
+@pytest.fixture(scope="session")
+def client():
+    # An in-memory database lives only while a connection to it is open
+    keeper = sqlite3.connect(get_database_path(), uri=True)
+    # Initialize DB and seed data once, and share one app lifespan across tests
+    init_database()
+    seed_sample_data()
+    with TestClient(app) as client:
+        yield client
+    keeper.close()
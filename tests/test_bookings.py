@@ -1,10 +1,117 @@
-from fastapi.testclient import TestClient
-from app.main import app
+import asyncio
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
-client = TestClient(app)
+from app.database import get_db_connection, get_writer_connection
+from app.services.class_service import invalidate_class_caches
 
 
-def test_health_check():
+def _create_class(slots, name="Test Class"):
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            """
+            INSERT INTO classes (name, instructor, datetime_utc, total_slots, available_slots, created_at)
+            VALUES (?, 'Test Instructor', ?, ?, ?, datetime('now'))
+            """,
+            (name, int(time.time()) + 86400, max(slots, 1), slots)
+        )
+        conn.commit()
+    invalidate_class_caches()
+    return cursor.lastrowid
+
+
+def _book(client, class_id, email="test@example.com"):
+    return client.post("/api/v1/book", json={
+        "class_id": class_id,
+        "client_name": "Test Client",
+        "client_email": email
+    })
+
+
+def test_health_check(client):
     response = client.get("/health")
     assert response.status_code == 200
-    assert "status" in response.json()
\ No newline at end of file
+    assert "status" in response.json()
+
+def test_booking_id_is_uuid7_with_unix_ms_prefix(client):
+    response = _book(client, _create_class(slots=1))
+    booking_id = uuid.UUID(response.json()["id"])
+    assert booking_id.version == 7
+    # RFC 9562 layout, the top 48 bits are unix epoch milliseconds
+    assert abs((booking_id.int >> 80) / 1000 - time.time()) < 60
+
+def test_get_bookings_by_email(client):
+    email = "history@example.com"
+    for name in ("First Class", "Second Class"):
+        assert _book(client, _create_class(slots=1, name=name), email=email).status_code == 200
+
+    response = client.get("/api/v1/bookings", params={"email": email})
+    assert response.status_code == 200
+    bookings = response.json()
+    # Newest first
+    assert [b["class_name"] for b in bookings] == ["Second Class", "First Class"]
+    for booking in bookings:
+        assert booking["client_email"] == email
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", booking["class_datetime_local"])
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", booking["booking_time"])
+
+def test_book_missing_class_returns_404(client):
+    response = _book(client, 999999)
+    assert response.status_code == 404
+
+def test_book_full_class_returns_409(client):
+    response = _book(client, _create_class(slots=0))
+    assert response.status_code == 409
+
+def test_concurrent_bookings_never_oversell(client):
+    class_id = _create_class(slots=1)
+    # Both requests run on the app's event loop at the same time
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        responses = list(pool.map(lambda _: _book(client, class_id), range(2)))
+    assert sorted(r.status_code for r in responses) == [200, 409]
+
+    with get_db_connection() as conn:
+        row = conn.execute("SELECT available_slots FROM classes WHERE id = ?", (class_id,)).fetchone()
+    assert row["available_slots"] == 0
+
+def test_cancelled_write_releases_writer(client):
+    async def cancel_mid_transaction():
+        started = asyncio.Event()
+
+        async def write():
+            async with get_writer_connection() as conn:
+                await conn.execute("BEGIN IMMEDIATE")
+                started.set()
+                await asyncio.Event().wait()
+
+        task = asyncio.create_task(write())
+        await started.wait()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    # Run on the app's event loop, where the writer connection lives
+    client.portal.call(cancel_mid_transaction)
+    assert _book(client, _create_class(slots=1)).status_code == 200
+
+def test_booking_invalidates_cached_class_list(client):
+    class_id = _create_class(slots=5)
+    params = {"upcoming_only": False, "limit": 100}
+
+    def available_slots():
+        classes = client.get("/api/v1/classes", params=params).json()
+        return next(c["available_slots"] for c in classes if c["id"] == class_id)
+
+    before = available_slots()
+    assert _book(client, class_id).status_code == 200
+    assert available_slots() == before - 1
+
+def test_booking_invalidates_cached_stats(client):
+    class_id = _create_class(slots=5)
+    before = client.get("/api/v1/classes/stats").json()["total_bookings"]
+    assert _book(client, class_id).status_code == 200
+    assert client.get("/api/v1/classes/stats").json()["total_bookings"] == before + 1
\ No newline at end of file
@@ -0,0 +1,34 @@
+import asyncio
+
+from app.utils.cache import AsyncTTLCache
+
+
+def test_single_flight_survives_invalidation():
+    cache = AsyncTTLCache(ttl=60)
+    running = 0
+    max_running = 0
+
+    async def loader():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return "value"
+
+    async def reader():
+        for _ in range(5):
+            await cache.get_or_load("key", loader)
+            await asyncio.sleep(0.001)
+
+    async def invalidator():
+        for _ in range(10):
+            await asyncio.sleep(0.003)
+            cache.invalidate()
+
+    async def main():
+        await asyncio.gather(*(reader() for _ in range(20)), invalidator())
+
+    asyncio.run(main())
+    assert max_running == 1
+    assert not cache._locks
\ No newline at end of file
@@ -1,15 +1,33 @@
-from fastapi.testclient import TestClient
-from app.main import app
-from app.database import init_database
-from scripts.seed_data import seed_sample_data
+def test_get_classes(client):
+    response = client.get("/api/v1/classes")
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
 
-# Initialize DB and seed data before tests
-init_database()
-seed_sample_data()
+def test_get_classes_cursor_pagination(client):
+    params = {"upcoming_only": False, "limit": 1}
+    seen = []
+    while True:
+        response = client.get("/api/v1/classes", params=params)
+        assert response.status_code == 200
+        seen.extend(c["id"] for c in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        params["after"] = cursor
 
-client = TestClient(app)
+    full = client.get("/api/v1/classes", params={"upcoming_only": False, "limit": 100})
+    assert seen == [c["id"] for c in full.json()]
 
-def test_get_classes():
-    response = client.get("/api/v1/classes")
-    assert response.status_code == 200
-    assert isinstance(response.json(), list)
\ No newline at end of file
+def test_get_classes_rejects_cursor_with_offset(client):
+    first = client.get("/api/v1/classes", params={"upcoming_only": False, "limit": 1})
+    cursor = first.headers["X-Next-Cursor"]
+    response = client.get("/api/v1/classes", params={"after": cursor, "offset": 1})
+    assert response.status_code == 400
+
+def test_cors_exposes_next_cursor(client):
+    response = client.get(
+        "/api/v1/classes",
+        params={"upcoming_only": False, "limit": 1},
+        headers={"Origin": "https://example.com"}
+    )
+    assert "x-next-cursor" in response.headers["access-control-expose-headers"].lower()
\ No newline at end of file
@@ -0,0 +1,91 @@
+import sqlite3
+
+import pytest
+
+from app.config import settings
+from app.database import init_database
+
+LEGACY_CLASSES_SQL = '''
+    CREATE TABLE classes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        instructor TEXT NOT NULL,
+        datetime_utc TEXT NOT NULL,
+        total_slots INTEGER NOT NULL,
+        available_slots INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+LEGACY_BOOKINGS_SQL = '''
+    CREATE TABLE bookings (
+        id TEXT PRIMARY KEY,
+        class_id INTEGER NOT NULL,
+        client_name TEXT NOT NULL,
+        client_email TEXT NOT NULL,
+        booking_time TEXT NOT NULL,
+        status TEXT DEFAULT 'confirmed',
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (class_id) REFERENCES classes (id)
+    )
+'''
+
+
+def _create_legacy_database(path, datetimes):
+    conn = sqlite3.connect(path)
+    conn.execute(LEGACY_CLASSES_SQL)
+    conn.execute(LEGACY_BOOKINGS_SQL)
+    conn.executemany(
+        "INSERT INTO classes (name, instructor, datetime_utc, total_slots, available_slots, created_at) "
+        "VALUES ('Yoga', 'Priya', ?, 10, 9, '2025-01-01T00:00:00')",
+        [(dt,) for dt in datetimes]
+    )
+    conn.commit()
+    return conn
+
+
+def test_migrates_legacy_text_datetimes(tmp_path, monkeypatch):
+    path = tmp_path / "legacy.db"
+    conn = _create_legacy_database(path, [
+        "2025-07-10T07:00:00",
+        "2025-07-10T07:00:00+00:00",
+        "2025-07-10T07:00:00Z",
+        "2025-07-10T07:00:00",
+    ])
+    conn.execute(
+        "INSERT INTO bookings (id, class_id, client_name, client_email, booking_time) "
+        "VALUES ('b1', 2, 'Test Client', 'test@example.com', '2025-07-01T00:00:00+00:00')"
+    )
+    # The highest id is gone, the counter must still stay past it
+    conn.execute("DELETE FROM classes WHERE id = 4")
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(settings, "DATABASE_FILE", str(path))
+    init_database()
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT id, datetime_utc FROM classes ORDER BY id").fetchall() == [
+        (1, 1752130800), (2, 1752130800), (3, 1752130800)
+    ]
+    columns = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(classes)")}
+    assert columns["datetime_utc"] == "INTEGER"
+    assert conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'classes'").fetchone() == (4,)
+    assert conn.execute("SELECT class_id FROM bookings").fetchall() == [(2,)]
+    assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+    conn.close()
+
+
+def test_migration_rejects_unparseable_datetimes(tmp_path, monkeypatch):
+    path = tmp_path / "legacy.db"
+    _create_legacy_database(path, ["2025-07-10T07:00:00", "not a date"]).close()
+
+    monkeypatch.setattr(settings, "DATABASE_FILE", str(path))
+    with pytest.raises(ValueError, match="not a date"):
+        init_database()
+
+    # Nothing was rebuilt
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT COUNT(*) FROM classes").fetchone() == (2,)
+    conn.close()
\ No newline at end of file